@@ -1,19 +1,219 @@
+import atexit
 import time
 import signal
 import sys
 import logging
+import re
 import sqlite3
-from typing import Optional, Dict, Any
-import os
+import threading
+import queue
+from collections import OrderedDict
+from concurrent.futures import Future
+import functools
+import operator
+from functools import lru_cache
+import anyio.to_thread
+from typing import Optional, Dict, Any, List
+from pathlib import Path
 from mcp.server.fastmcp import FastMCP
 import argparse
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Database setup
-DB_NAME = os.path.abspath(os.path.join(os.path.dirname(os.path.dirname(__file__)), "db/database.db"))
+# Database setup: resolve the default path once at import
+DB_NAME = str(Path(__file__).resolve().parent.parent / "db" / "database.db")
+
+# Shared database connection, opened lazily and reused across tool calls.
+# Opening a fresh connection per query dominates latency for the small
+# queries these tools issue, so keep one around for the process lifetime.
+_conn: Optional[sqlite3.Connection] = None
+_conn_lock = threading.Lock()
+
+def _get_conn() -> sqlite3.Connection:
+    """
+    Return the shared database connection, opening it on first use.
+    """
+    global _conn
+    if _conn is None:
+        _conn = sqlite3.connect(
+            DB_NAME,
+            check_same_thread=False,
+            isolation_level=None,
+            cached_statements=256,
+        )
+        # No row_factory: raw tuples are cheaper to fetch than sqlite3.Row,
+        # and execute_query zips them with the column names itself
+        _apply_pragmas(_conn)
+    return _conn
+
+def _apply_pragmas(conn: sqlite3.Connection):
+    """
+    Tune the connection for the server workload.
+
+    WAL mode commits with a single fsync and lets readers run while a
+    write is in progress. Note that WAL creates -wal/-shm sidecar files
+    next to the database file.
+    """
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-64000")
+    conn.execute("PRAGMA mmap_size=268435456")
+    conn.execute("PRAGMA busy_timeout=5000")
+
+def _close_conn():
+    """
+    Close the shared database connection if it is open.
+    """
+    global _conn
+    if _conn is not None:
+        _conn.close()
+        _conn = None
+    _invalidate_schema()
+    _invalidate_read_cache()
+
+def _quote_identifier(name: str) -> str:
+    """
+    Quote a table/column name for safe interpolation into SQL, so
+    reserved words and special characters cannot break the statement.
+    """
+    escaped = name.replace('"', '""')
+    return f'"{escaped}"'
+
+# Cached table/column names, loaded lazily from sqlite_master
+_schema_cache: Optional[Dict[str, frozenset]] = None
+_schema_lock = threading.Lock()
+
+def _get_schema() -> Dict[str, frozenset]:
+    """
+    Return a mapping of table name -> frozenset of column names,
+    loading it from the database on first use. The double-checked lock
+    keeps concurrent tool calls from loading the schema twice.
+    """
+    global _schema_cache
+    if _schema_cache is None:
+        with _schema_lock:
+            if _schema_cache is None:
+                conn = _get_conn()
+                with _conn_lock:
+                    # Skip SQLite's internal tables (sqlite_sequence etc.):
+                    # they are not part of the application schema and some,
+                    # like sqlite_sequence, may not even be indexed
+                    tables = [
+                        row[0] for row in
+                        conn.execute(
+                            "SELECT name FROM sqlite_master "
+                            "WHERE type='table' AND name NOT LIKE 'sqlite\\_%' ESCAPE '\\'"
+                        ).fetchall()
+                    ]
+                    _schema_cache = {
+                        table: frozenset(
+                            row[1] for row in  # table_info: (cid, name, type, ...)
+                            conn.execute(f"PRAGMA table_info({_quote_identifier(table)})").fetchall()
+                        )
+                        for table in tables
+                    }
+    return _schema_cache
+
+def _invalidate_schema():
+    """
+    Drop the cached schema so it is reloaded on next use.
+    """
+    global _schema_cache
+    _schema_cache = None
+
+# Cache of recent read-only query results, keyed on (query, parameters,
+# columnar). MCP agents frequently re-poll the same reads; a hit skips
+# SQLite entirely. Each entry records the tables its query references so
+# a write only evicts the entries it can actually affect. Only the
+# wrapper read tools opt in: their SQL is schema-derived and
+# deterministic, whereas arbitrary sqlite_query reads may use
+# nondeterministic functions (datetime('now'), random()) or see writes
+# from other processes that in-process invalidation cannot observe.
+_READ_CACHE_MAX = 256
+_read_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+
+# Tables referenced by a read (FROM/JOIN clauses)
+_READ_TABLES_RE = re.compile(r"\b(?:FROM|JOIN)\s+[\"'`\[]?([A-Za-z_]\w*)", re.IGNORECASE)
+# Target table of a DML statement
+_DML_TABLE_RE = re.compile(
+    r"^\s*(?:INSERT\s+(?:OR\s+\w+\s+)?INTO|UPDATE|DELETE\s+FROM)\s+[\"'`\[]?([A-Za-z_]\w*)",
+    re.IGNORECASE,
+)
+# Statements that change the schema itself
+_DDL_RE = re.compile(r"^\s*(?:CREATE|DROP|ALTER|VACUUM|REINDEX)\b", re.IGNORECASE)
+
+def _referenced_tables(query: str) -> frozenset:
+    """
+    Extract the table names a read query references, lowercased.
+    """
+    return frozenset(name.lower() for name in _READ_TABLES_RE.findall(query))
+
+def _invalidate_table(table_name: str):
+    """
+    Evict cached reads that reference the given table. Entries whose
+    tables could not be determined are evicted too, to stay correct.
+    """
+    table = table_name.lower()
+    stale = [
+        key for key, (_, tables) in _read_cache.items()
+        if not tables or table in tables
+    ]
+    for key in stale:
+        del _read_cache[key]
+
+def _invalidate_for_write(query: str):
+    """
+    Invalidate caches affected by a successful write. DDL drops the
+    schema cache and every cached read; DML evicts reads of its target
+    table, falling back to clearing the whole cache when the table
+    cannot be determined.
+    """
+    if _DDL_RE.match(query):
+        _invalidate_schema()
+        _invalidate_read_cache()
+        return
+    match = _DML_TABLE_RE.match(query)
+    if match:
+        _invalidate_table(match.group(1))
+    else:
+        _invalidate_read_cache()
+
+def _read_cache_key(query: str, parameters: Optional[Any], columnar: bool) -> Optional[tuple]:
+    """
+    Build a hashable cache key for a query, or None if the parameters
+    cannot be hashed.
+    """
+    try:
+        if parameters is None:
+            params_key = ()
+        elif isinstance(parameters, dict):
+            params_key = tuple(sorted(parameters.items()))
+        else:
+            params_key = tuple(parameters)
+        hash(params_key)
+    except TypeError:
+        return None
+    return (query, params_key, columnar)
+
+def _invalidate_read_cache():
+    """
+    Drop all cached read results; called after any write.
+    """
+    _read_cache.clear()
+
+def _validate_identifiers(table_name: str, *columns: str) -> Optional[str]:
+    """
+    Check table/column names against the cached schema before they are
+    interpolated into SQL. Returns an error message, or None if valid.
+    """
+    schema = _get_schema()
+    if table_name not in schema:
+        return f"Unknown table: {table_name}"
+    for column in columns:
+        if column not in schema[table_name]:
+            return f"Unknown column '{column}' in table '{table_name}'"
+    return None
 
 def signal_handler(sig, frame):
     """
@@ -33,71 +233,460 @@ def validate_database():
     Validate database existence and accessibility.
     Creates the database directory if it doesn't exist.
     """
-    db_dir = os.path.dirname(DB_NAME)
-    
+    db_dir = Path(DB_NAME).parent
+
     # Create directory structure if it doesn't exist
-    if not os.path.exists(db_dir):
-        try:
-            os.makedirs(db_dir)
-            logger.info(f"Created database directory: {db_dir}")
-        except Exception as e:
-            logger.error(f"Failed to create database directory: {e}")
-            sys.exit(1)
+    try:
+        db_dir.mkdir(parents=True, exist_ok=True)
+    except Exception as e:
+        logger.error("Failed to create database directory: %s", e)
+        sys.exit(1)
     
-    # Test database connection
+    # Open the shared connection once; tool calls reuse it afterwards
     try:
-        conn = sqlite3.connect(DB_NAME)
-        conn.close()
-        logger.info(f"Successfully connected to database at: {DB_NAME}")
+        _get_conn()
+        _ensure_indexes()
+        # atexit handlers run in reverse order: optimize first, then close
+        atexit.register(_close_conn)
+        atexit.register(_run_optimize)
+        _start_optimize_timer()
+        logger.info("Successfully connected to database at: %s", DB_NAME)
     except sqlite3.Error as e:
-        logger.error(f"Database connection failed: {e}")
-        logger.error(f"Database path: {DB_NAME}")
-        logger.error(f"Check if you have write permissions to: {db_dir}")
+        logger.error("Database connection failed: %s", e)
+        logger.error("Database path: %s", DB_NAME)
+        logger.error("Check if you have write permissions to: %s", db_dir)
         sys.exit(1)
 
 # Initialize the FastMCP server
 mcp = FastMCP(name="sqlite-mcp")
 
-@mcp.tool(name="sqlite_query", description="Execute a SQL query on the SQLite database")
-def execute_query(query: str, parameters: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+def _tool(name: str, description: str):
+    """
+    Register a synchronous tool function as an async FastMCP tool.
+
+    FastMCP runs synchronous tools directly on the event loop, so a slow
+    query would block every other in-flight request. The wrapper runs the
+    tool on a worker thread instead, and the original sync function is
+    returned so in-process callers (and the tests) can keep calling it
+    directly.
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            return await anyio.to_thread.run_sync(functools.partial(fn, *args, **kwargs))
+        mcp.tool(name=name, description=description)(wrapper)
+        return fn
+    return decorator
+
+@_tool(name="sqlite_query", description="Execute a SQL query on the SQLite database")
+def execute_query(query: str, parameters: Optional[Dict[str, Any]] = None, columnar: bool = False,
+                  cache: bool = False) -> Dict[str, Any]:
     """
     Execute a SQL query on the SQLite database.
 
     Args:
         query (str): The SQL query string.
         parameters (Optional[Dict[str, Any]]): Optional dictionary of parameters for parameterized queries.
+        columnar (bool): If True, return results as {"columns": [...], "rows": [[...], ...]}
+            instead of a list of dicts. This avoids repeating the column names
+            on every row, which shrinks the payload for large result sets.
+        cache (bool): If True, serve repeated reads from the in-process result
+            cache. Off by default: the cache cannot see writes from other
+            processes and must not capture nondeterministic queries.
 
     Returns:
         Dict[str, Any]: A dictionary indicating success/failure and containing the results or error.
     """
     # Additional comment: This function handles both read (SELECT) and write (INSERT/UPDATE/DELETE) queries
-    conn = None
     try:
-        conn = sqlite3.connect(DB_NAME)
-        conn.row_factory = sqlite3.Row  # Return rows as dictionaries
-        cursor = conn.cursor()
+        key = _read_cache_key(query, parameters, columnar) if cache else None
+        conn = _get_conn()
+        with _conn_lock:
+            if key is not None and key in _read_cache:
+                _read_cache.move_to_end(key)
+                return _read_cache[key][0]
+
+            cursor = conn.execute(query, parameters or ())
+
+            # Statements that return rows (SELECT, WITH ... SELECT, PRAGMA,
+            # EXPLAIN) have a non-None cursor.description
+            if cursor.description is not None:
+                # Fetch in bounded batches so only one batch of Row objects
+                # is alive at a time while converting to dicts
+                cursor.arraysize = 1000
+                columns = tuple(d[0] for d in cursor.description)
+                if columnar:
+                    rows = []
+                    while True:
+                        chunk = cursor.fetchmany()
+                        if not chunk:
+                            break
+                        rows.extend(list(row) for row in chunk)
+                    result = {"success": True, "columns": list(columns), "rows": rows}
+                else:
+                    # dict(zip(...)) over raw tuples runs entirely in C,
+                    # unlike iterating a sqlite3.Row per row
+                    results = []
+                    while True:
+                        chunk = cursor.fetchmany()
+                        if not chunk:
+                            break
+                        results.extend(dict(zip(columns, row)) for row in chunk)
+                    result = {"success": True, "results": results}
+
+                if key is not None:
+                    _read_cache[key] = (result, _referenced_tables(query))
+                    if len(_read_cache) > _READ_CACHE_MAX:
+                        _read_cache.popitem(last=False)
+                return result
+            else:
+                # The connection runs in autocommit mode (isolation_level=None),
+                # so single-statement writes are already durable here
+                _invalidate_for_write(query)
+                return {
+                    "success": True,
+                    "message": "Query executed successfully",
+                    "lastrowid": cursor.lastrowid,
+                    "rowcount": cursor.rowcount
+                }
 
-        if parameters:
-            cursor.execute(query, parameters)
-        else:
-            cursor.execute(query)
+    except Exception as e:
+        logger.error("Error executing query: %s", e)
+        return {"success": False, "error": str(e)}
 
-        if query.strip().lower().startswith("select"):
-            results = cursor.fetchall()
-            results = [dict(row) for row in results]
-            return {"success": True, "results": results}
-        else:
+# How often to refresh the query planner statistics
+_OPTIMIZE_INTERVAL_SECONDS = 600
+
+def _run_optimize():
+    """
+    Refresh query planner statistics on the shared connection.
+    """
+    if _conn is None:
+        return
+    try:
+        with _conn_lock:
+            _conn.execute("PRAGMA optimize")
+    except Exception as e:
+        logger.error("PRAGMA optimize failed: %s", e)
+
+def _start_optimize_timer():
+    """
+    Schedule the next periodic PRAGMA optimize run.
+    """
+    timer = threading.Timer(_OPTIMIZE_INTERVAL_SECONDS, _schedule_optimize)
+    timer.daemon = True
+    timer.start()
+
+def _schedule_optimize():
+    """
+    Run PRAGMA optimize periodically so the planner statistics stay
+    current for long-lived server processes.
+    """
+    _run_optimize()
+    _start_optimize_timer()
+
+def _ensure_indexes():
+    """
+    Create indexes on 'name' columns so get_item lookups by name use a
+    B-tree search instead of a full table scan.
+    """
+    schema = _get_schema()
+    conn = _get_conn()
+    with _conn_lock:
+        for table, columns in schema.items():
+            if "name" in columns:
+                conn.execute(
+                    f"CREATE INDEX IF NOT EXISTS {_quote_identifier(f'idx_{table}_name')} "
+                    f"ON {_quote_identifier(table)}(name)"
+                )
+
+# SQLite allows a single writer at a time, so all writes from the wrapper
+# tools are funneled through one background thread. This serializes write
+# access without SQLITE_BUSY retries under concurrent tool calls.
+_write_q: "queue.Queue[tuple]" = queue.Queue()
+_writer_thread: Optional[threading.Thread] = None
+_writer_start_lock = threading.Lock()
+
+def _writer_loop():
+    """
+    Drain the write queue, executing each submitted call and resolving
+    its future with the result.
+    """
+    while True:
+        future, fn, args = _write_q.get()
+        try:
+            future.set_result(fn(*args))
+        except Exception as e:
+            future.set_exception(e)
+        finally:
+            _write_q.task_done()
+
+def _submit_write(fn, *args) -> Dict[str, Any]:
+    """
+    Run a write call on the dedicated writer thread and wait for its result.
+    """
+    global _writer_thread
+    with _writer_start_lock:
+        if _writer_thread is None or not _writer_thread.is_alive():
+            _writer_thread = threading.Thread(
+                target=_writer_loop, name="sqlite-mcp-writer", daemon=True
+            )
+            _writer_thread.start()
+
+    future: Future = Future()
+    _write_q.put((future, fn, args))
+    return future.result()
+
+@lru_cache(maxsize=512)
+def _build_select_sql(table_name: str, column: str) -> str:
+    """
+    Build (and memoize) the point-lookup query for a (table, column) pair.
+
+    Keeping the SQL text identical across calls lets SQLite reuse the
+    prepared statement from the connection's statement cache.
+    """
+    return f"SELECT * FROM {_quote_identifier(table_name)} WHERE {_quote_identifier(column)} = ?;"
+
+@lru_cache(maxsize=512)
+def _build_update_sql(table_name: str, data_columns: tuple, column: str) -> tuple:
+    """
+    Build (and memoize) the UPDATE statement for a (table, columns, key
+    column) combination, so repeated updates with the same column set
+    skip the string assembly and reuse the prepared statement.
+
+    Returns the SQL plus a callable that pulls the SET values out of a
+    row dict in column order (itemgetter runs in C).
+    """
+    set_clause = ", ".join(f"{_quote_identifier(c)} = ?" for c in data_columns)
+    sql = f"UPDATE {_quote_identifier(table_name)} SET {set_clause} WHERE {_quote_identifier(column)} = ?;"
+    if len(data_columns) == 1:
+        # itemgetter with one key returns a scalar; normalize to a tuple
+        single = data_columns[0]
+        get_values = lambda row: (row[single],)
+    else:
+        get_values = operator.itemgetter(*data_columns)
+    return sql, get_values
+
+@lru_cache(maxsize=512)
+def _build_delete_sql(table_name: str, column: str) -> str:
+    """
+    Build (and memoize) the DELETE statement for a (table, column) pair.
+    """
+    return f"DELETE FROM {_quote_identifier(table_name)} WHERE {_quote_identifier(column)} = ?;"
+
+@lru_cache(maxsize=512)
+def _build_insert_sql(table_name: str, columns: tuple) -> str:
+    """
+    Build (and memoize) the INSERT statement for a (table, columns) pair.
+    """
+    column_list = ", ".join(_quote_identifier(c) for c in columns)
+    placeholders = ", ".join(["?" for _ in columns])
+    return f"INSERT INTO {_quote_identifier(table_name)} ({column_list}) VALUES ({placeholders});"
+
+def _execute_many(query: str, seq: List[tuple]) -> Dict[str, Any]:
+    """
+    Execute a parameterized statement for a sequence of parameter tuples
+    inside a single transaction.
+
+    Args:
+        query (str): The parameterized SQL statement.
+        seq (List[tuple]): Parameter tuples, one per execution.
+
+    Returns:
+        Dict[str, Any]: A dictionary indicating success/failure and the affected row count.
+    """
+    try:
+        conn = _get_conn()
+        with _conn_lock:
+            # The rollback must also happen under the lock: once the lock
+            # is released, another thread could execute inside the
+            # still-open transaction and have its work silently undone.
+            own_txn = False
+            try:
+                # BEGIN IMMEDIATE takes the write lock up front so the batch
+                # cannot deadlock against a concurrent writer mid-transaction.
+                # When a caller-managed batch is open, join it instead.
+                if not conn.in_transaction:
+                    conn.execute("BEGIN IMMEDIATE")
+                    own_txn = True
+                cursor = conn.executemany(query, seq)
+                if own_txn:
+                    conn.commit()
+                _invalidate_for_write(query)
+                return {"success": True, "rowcount": cursor.rowcount}
+            except Exception:
+                if own_txn and conn.in_transaction:
+                    conn.rollback()
+                raise
+    except Exception as e:
+        logger.error("Error executing batch query: %s", e)
+        return {"success": False, "error": str(e)}
+
+@_tool(name="bulk_create_items", description="Insert multiple rows into a specified table in one transaction")
+def bulk_create_items(table_name: str, rows: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Inserts multiple rows into the specified table within one transaction.
+
+    Args:
+        table_name (str): The name of the table to insert into.
+        rows (List[Dict[str, Any]]): List of dictionaries, one per row. All rows must share the same columns.
+
+    Returns:
+        Dict[str, Any]: A dictionary indicating success/failure and the number of rows inserted.
+    """
+    if not rows:
+        return {"success": False, "error": "No rows provided"}
+
+    columns = list(rows[0].keys())
+    if any(list(row.keys()) != columns for row in rows):
+        return {"success": False, "error": "All rows must have the same columns"}
+
+    error = _validate_identifiers(table_name, *columns)
+    if error:
+        return {"success": False, "error": error}
+
+    query = _build_insert_sql(table_name, tuple(columns))
+
+    result = _submit_write(_execute_many, query, [tuple(row[c] for c in columns) for row in rows])
+    if result["success"]:
+        return {
+            "success": True,
+            "message": f"{len(rows)} items created successfully",
+            "inserted": result["rowcount"]
+        }
+    return result
+
+@_tool(name="bulk_update_items", description="Update multiple rows in a specified table in one transaction")
+def bulk_update_items(table_name: str, rows: List[Dict[str, Any]], column: str) -> Dict[str, Any]:
+    """
+    Updates multiple rows in the specified table within one transaction.
+
+    Args:
+        table_name (str): The name of the table to update.
+        rows (List[Dict[str, Any]]): List of dictionaries, one per row. Each must contain
+            the key column plus the columns to update, and all rows must share the same columns.
+        column (str): The name of the key column identifying each row.
+
+    Returns:
+        Dict[str, Any]: A dictionary indicating success/failure and the number of rows updated.
+    """
+    if not rows:
+        return {"success": False, "error": "No rows provided"}
+    if any(column not in row for row in rows):
+        return {"success": False, "error": f"All rows must contain the key column '{column}'"}
+
+    data_columns = [c for c in rows[0].keys() if c != column]
+    if not data_columns:
+        return {"success": False, "error": "Rows contain no columns to update"}
+    if any([c for c in row.keys() if c != column] != data_columns for row in rows):
+        return {"success": False, "error": "All rows must have the same columns"}
+
+    error = _validate_identifiers(table_name, column, *data_columns)
+    if error:
+        return {"success": False, "error": error}
+
+    query, get_values = _build_update_sql(table_name, tuple(data_columns), column)
+
+    result = _submit_write(_execute_many, query, [get_values(row) + (row[column],) for row in rows])
+    if result["success"]:
+        return {
+            "success": True,
+            "message": f"{result['rowcount']} items updated successfully"
+        }
+    return result
+
+@_tool(name="bulk_delete_items", description="Delete multiple rows from a specified table in one transaction")
+def bulk_delete_items(table_name: str, values: List[Any], column: str) -> Dict[str, Any]:
+    """
+    Deletes multiple rows from the specified table within one transaction.
+
+    Args:
+        table_name (str): The name of the table to delete from.
+        values (List[Any]): The key values of the rows to delete.
+        column (str): The name of the key column.
+
+    Returns:
+        Dict[str, Any]: A dictionary indicating success/failure and the number of rows deleted.
+    """
+    if not values:
+        return {"success": False, "error": "No values provided"}
+
+    error = _validate_identifiers(table_name, column)
+    if error:
+        return {"success": False, "error": error}
+
+    query = _build_delete_sql(table_name, column)
+
+    result = _submit_write(_execute_many, query, [(value,) for value in values])
+    if result["success"]:
+        return {
+            "success": True,
+            "message": f"{result['rowcount']} items deleted successfully"
+        }
+    return result
+
+@_tool(name="begin_batch", description="Begin a transaction that spans subsequent write tool calls")
+def begin_batch() -> Dict[str, Any]:
+    """
+    Opens a transaction on the shared connection so subsequent write
+    tool calls are grouped into a single commit, until end_batch.
+
+    Returns:
+        Dict[str, Any]: A dictionary indicating success/failure.
+    """
+    try:
+        conn = _get_conn()
+        with _conn_lock:
+            if conn.in_transaction:
+                return {"success": False, "error": "A batch is already in progress"}
+            conn.execute("BEGIN IMMEDIATE")
+        return {"success": True, "message": "Batch started"}
+    except Exception as e:
+        return {"success": False, "error": str(e)}
+
+@_tool(name="end_batch", description="Commit the transaction started by begin_batch")
+def end_batch() -> Dict[str, Any]:
+    """
+    Commits the transaction opened by begin_batch, making all writes
+    since then durable with a single commit.
+
+    Returns:
+        Dict[str, Any]: A dictionary indicating success/failure.
+    """
+    try:
+        conn = _get_conn()
+        with _conn_lock:
+            if not conn.in_transaction:
+                return {"success": False, "error": "No batch in progress"}
             conn.commit()
-            return {"success": True, "message": "Query executed successfully"}
-        
+        return {"success": True, "message": "Batch committed"}
     except Exception as e:
-        logger.error(f"Error executing query: {str(e)}")
         return {"success": False, "error": str(e)}
-    finally:
-        if conn:
-            conn.close()
 
-@mcp.tool(name="get_item", description="Retrieve a single row from a specified table")
+@_tool(name="rollback_batch", description="Abort the transaction started by begin_batch, discarding its writes")
+def rollback_batch() -> Dict[str, Any]:
+    """
+    Rolls back the transaction opened by begin_batch, discarding every
+    write made since then and releasing the database write lock.
+
+    Returns:
+        Dict[str, Any]: A dictionary indicating success/failure.
+    """
+    try:
+        conn = _get_conn()
+        with _conn_lock:
+            if not conn.in_transaction:
+                return {"success": False, "error": "No batch in progress"}
+            conn.rollback()
+            # Reads served during the batch saw its uncommitted writes;
+            # drop anything cached since, including a reloaded schema
+            _invalidate_schema()
+            _invalidate_read_cache()
+        return {"success": True, "message": "Batch rolled back"}
+    except Exception as e:
+        return {"success": False, "error": str(e)}
+
+@_tool(name="get_item", description="Retrieve a single row from a specified table")
 def get_item(table_name: str, value: str, column: str) -> Dict[str, Any]:
     """
     Retrieves a single row from the specified table.
@@ -110,13 +699,17 @@ def get_item(table_name: str, value: str, column: str) -> Dict[str, Any]:
     Returns:
         Dict[str, Any]: A dictionary containing the query result or an error.
     """
+    error = _validate_identifiers(table_name, column)
+    if error:
+        return {"success": False, "error": error}
+
     # Using parameterized query to prevent SQL injection
-    query = f"SELECT * FROM {table_name} WHERE {column} = ?;"
+    query = _build_select_sql(table_name, column)
     parameters = (value,)
 
-    return execute_query(query, parameters)
+    return execute_query(query, parameters, cache=True)
 
-@mcp.tool(name="update_item", description="Update an existing row in a specified table")
+@_tool(name="update_item", description="Update an existing row in a specified table")
 def update_item(table_name: str, value: Any, data: Dict[str, Any], column: str) -> Dict[str, Any]:
     """
     Updates an existing row in the specified table.
@@ -130,24 +723,28 @@ def update_item(table_name: str, value: Any, data: Dict[str, Any], column: str)
     Returns:
         Dict[str, Any]: A dictionary indicating success/failure and containing the result or error.
     """
-    set_clause = ", ".join([f"{k} = ?" for k in data.keys()])
-    query = f"UPDATE {table_name} SET {set_clause} WHERE {column} = ?;"
-    
+    if not data:
+        return {"success": False, "error": "No data provided"}
+
+    error = _validate_identifiers(table_name, column, *data.keys())
+    if error:
+        return {"success": False, "error": error}
+
+    query, get_values = _build_update_sql(table_name, tuple(data.keys()), column)
+
     # Add id_value to the parameters
-    parameters = tuple(data.values()) + (value,)
+    parameters = get_values(data) + (value,)
+
+    # execute_query already reports failures as {"success": False, ...}
+    result = _submit_write(execute_query, query, parameters)
+    if result["success"]:
+        return {
+            "success": True,
+            "message": "Item updated successfully"
+        }
+    return result
     
-    try:
-        result = execute_query(query, parameters)
-        if result["success"]:
-            return {
-                "success": True,
-                "message": "Item updated successfully"
-            }
-        return result
-    except Exception as e:
-        return {"success": False, "error": str(e)}
-    
-@mcp.tool(name="delete_item", description="Delete a row from a specified table")
+@_tool(name="delete_item", description="Delete a row from a specified table")
 def delete_item(table_name: str, value: Any, column: str) -> Dict[str, Any]:
     """
     Deletes a row from the specified table.
@@ -160,20 +757,21 @@ def delete_item(table_name: str, value: Any, column: str) -> Dict[str, Any]:
     Returns:
         Dict[str, Any]: A dictionary indicating success/failure and containing the result or error.
     """
-    query = f"DELETE FROM {table_name} WHERE {column} = ?;"
-    
-    try:
-        result = execute_query(query, (value,))
-        if result["success"]:
-            return {
-                "success": True,
-                "message": "Item deleted successfully"
-            }
-        return result
-    except Exception as e:
-        return {"success": False, "error": str(e)}
+    error = _validate_identifiers(table_name, column)
+    if error:
+        return {"success": False, "error": error}
+
+    query = _build_delete_sql(table_name, column)
+
+    result = _submit_write(execute_query, query, (value,))
+    if result["success"]:
+        return {
+            "success": True,
+            "message": "Item deleted successfully"
+        }
+    return result
     
-@mcp.tool(name="create_item", description="Create a new row in a specified table")
+@_tool(name="create_item", description="Create a new row in a specified table")
 def create_item(table_name: str, data: Dict[str, Any]) -> Dict[str, Any]:
     """
     Creates a new row in the specified table with the provided data.
@@ -185,43 +783,43 @@ def create_item(table_name: str, data: Dict[str, Any]) -> Dict[str, Any]:
     Returns:
         Dict[str, Any]: A dictionary indicating success/failure and containing the new row's ID or error.
     """
-    columns = ", ".join(data.keys())
-    placeholders = ", ".join(["?" for _ in data])
-    query = f"INSERT INTO {table_name} ({columns}) VALUES ({placeholders});"
-    
-    try:
-        result = execute_query(query, tuple(data.values()))
-        if result["success"]:
-            # Get the last inserted row ID
-            last_id_query = "SELECT last_insert_rowid();"
-            id_result = execute_query(last_id_query)
-            if id_result["success"]:
-                return {
-                    "success": True,
-                    "message": "Item created successfully",
-                    "id": id_result["results"][0]["last_insert_rowid()"]
-                }
-        return result
-    except Exception as e:
-        return {"success": False, "error": str(e)}
+    error = _validate_identifiers(table_name, *data.keys())
+    if error:
+        return {"success": False, "error": error}
 
-@mcp.tool(name="get_all_items", description="Retrieve all rows from a specified table in the SQLite database")
-def get_all_items(table_name: str) -> Dict[str, Any]:
+    query = _build_insert_sql(table_name, tuple(data.keys()))
+    
+    result = _submit_write(execute_query, query, tuple(data.values()))
+    if result["success"]:
+        # The cursor already knows the last inserted row ID
+        return {
+            "success": True,
+            "message": "Item created successfully",
+            "id": result["lastrowid"]
+        }
+    return result
+
+@_tool(name="get_all_items", description="Retrieve all rows from a specified table in the SQLite database")
+def get_all_items(table_name: str, columnar: bool = False) -> Dict[str, Any]:
     """
     Retrieves all rows from the specified table.
 
     Args:
         table_name (str): The name of the table to query.
+        columnar (bool): If True, return {"columns": [...], "rows": [[...], ...]}
+            instead of a list of dicts, which shrinks the payload for large tables.
 
     Returns:
         Dict[str, Any]: A dictionary containing the query results or an error.
     """
-    # IMPORTANT: This is a simple example.
-    # In a real application, sanitize/validate 'table_name' to avoid SQL injection!
-    query = f"SELECT * FROM {table_name};"
-    return execute_query(query)
+    error = _validate_identifiers(table_name)
+    if error:
+        return {"success": False, "error": error}
+
+    query = f"SELECT * FROM {_quote_identifier(table_name)};"
+    return execute_query(query, columnar=columnar, cache=True)
 
-@mcp.tool(name="get_all_tables", description="Returns a list of all table names in the SQLite database")
+@_tool(name="get_all_tables", description="Returns a list of all table names in the SQLite database")
 def get_all_tables() -> Dict[str, Any]:
     """
     Fetch all table names from the SQLite database.
@@ -232,12 +830,19 @@ def get_all_tables() -> Dict[str, Any]:
     query = """
     SELECT name 
     FROM sqlite_master 
-    WHERE type='table' 
+    WHERE type='table'
     ORDER BY name;
     """
-    return execute_query(query)
+    return execute_query(query, cache=True)
 
-@mcp.tool(name="get_db_version", description="Returns the version of the SQLite database")
+# The SQLite version is baked into the linked library and never changes
+# for the lifetime of the process, so serve it as a constant
+_SQLITE_VERSION_RESULT = {
+    "success": True,
+    "results": [{"sqlite_version()": sqlite3.sqlite_version}]
+}
+
+@_tool(name="get_db_version", description="Returns the version of the SQLite database")
 def get_db_version() -> Dict[str, Any]:
     """
     Fetch the version information of the SQLite database.
@@ -245,8 +850,31 @@ def get_db_version() -> Dict[str, Any]:
     Returns:
         Dict[str, Any]: A dictionary containing the database version information or an error.
     """
-    query = "SELECT sqlite_version();"
-    return execute_query(query)
+    return _SQLITE_VERSION_RESULT
+
+def _install_fast_json():
+    """
+    Serialize tool responses with orjson when it is installed.
+
+    FastMCP serializes every tool result dict with the stdlib json
+    module, which dominates response time for large result sets. mcp
+    1.6.0 exposes no serializer hook, so point the fastmcp server
+    module's json reference at an orjson-backed dumps instead. Falls
+    back silently to stdlib json when orjson is not available.
+    """
+    try:
+        import orjson
+    except ImportError:
+        return
+
+    from types import SimpleNamespace
+    import mcp.server.fastmcp.server as fastmcp_server
+
+    def dumps(obj, **kwargs):
+        return orjson.dumps(obj).decode()
+
+    fastmcp_server.json = SimpleNamespace(dumps=dumps)
+    logger.info("Using orjson for response serialization")
 
 def parse_arguments():
     """
@@ -275,16 +903,20 @@ def main():
     """
     Main entry point for the MCP server.
     """
+    # Configure logging here rather than at import, so importing the
+    # module (e.g. from tests) does not reconfigure the root logger
+    logging.basicConfig(level=logging.INFO)
+
     args = parse_arguments()
     
-    # Update DB_NAME with command line argument
+    # Update DB_NAME with command line argument, resolved once
     global DB_NAME
-    print(f"Database path 1: {DB_NAME}")
-    DB_NAME = os.path.abspath(args.db_path)
-    
+    DB_NAME = str(Path(args.db_path).resolve())
+
     print(f"Database path: {DB_NAME}")
     setup_signal_handling()
     validate_database()
+    _install_fast_json()
 
     print(f"Starting MCP server 'sqlite-mcp' on {args.host}:{args.port}")
     mcp.run()
@@ -293,6 +925,6 @@ if __name__ == "__main__":
     try:
         main()
     except Exception as e:
-        logger.error(f"Error: {e}")
+        logger.error("Error: %s", e)
         # Sleep before exiting to give time for error logs
         time.sleep(5)
@@ -8,66 +8,53 @@ import tempfile
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 from src.entry import execute_query, get_item, get_all_items, get_all_tables
 from src.entry import update_item, delete_item, create_item
+from src.entry import bulk_create_items, bulk_update_items, bulk_delete_items
 
 @pytest.fixture
 def test_db():
-    """Create a temporary test database with sample data"""
-    # Create a temporary file for the test database
-    fd, db_path = tempfile.mkstemp()
-    os.close(fd)
-    
-    # Connect to the database and create test schema
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-    
-    # Create a test table
-    cursor.execute('''
+    """Create an in-memory test database with sample data"""
+    # Point the module at an in-memory database; no filesystem I/O needed
+    import src.entry
+    original_db = src.entry.DB_NAME
+    src.entry._close_conn()
+    src.entry.DB_NAME = ":memory:"
+
+    # Create the test schema on the module's shared connection
+    conn = src.entry._get_conn()
+    conn.executescript('''
     CREATE TABLE users (
         id INTEGER PRIMARY KEY,
         name TEXT NOT NULL,
         email TEXT UNIQUE,
         age INTEGER
-    )
+    );
+    CREATE TABLE products (
+        id INTEGER PRIMARY KEY,
+        name TEXT NOT NULL,
+        price REAL NOT NULL
+    );
     ''')
-    
+
     # Insert test data
     test_data = [
         (1, 'Alice', 'alice@example.com', 30),
         (2, 'Bob', 'bob@example.com', 25),
         (3, 'Charlie', 'charlie@example.com', 35)
     ]
-    cursor.executemany('INSERT INTO users VALUES (?, ?, ?, ?)', test_data)
-    
-    # Create another test table
-    cursor.execute('''
-    CREATE TABLE products (
-        id INTEGER PRIMARY KEY,
-        name TEXT NOT NULL,
-        price REAL NOT NULL
-    )
-    ''')
-    
+    conn.executemany('INSERT INTO users VALUES (?, ?, ?, ?)', test_data)
+
     # Insert product data
     product_data = [
         (1, 'Laptop', 999.99),
         (2, 'Phone', 499.99)
     ]
-    cursor.executemany('INSERT INTO products VALUES (?, ?, ?)', product_data)
-    
-    # Commit and close
-    conn.commit()
-    conn.close()
-    
-    # Patch the DB_NAME variable in the module
-    import src.entry
-    original_db = src.entry.DB_NAME
-    src.entry.DB_NAME = db_path
-    
-    yield db_path
-    
+    conn.executemany('INSERT INTO products VALUES (?, ?, ?)', product_data)
+
+    yield conn
+
     # Clean up
+    src.entry._close_conn()
     src.entry.DB_NAME = original_db
-    os.unlink(db_path)
 
 
 def test_execute_query(test_db):
@@ -208,4 +195,285 @@ def test_create_item(test_db):
     
     result = create_item("products", new_product)
     assert result["success"] is True
-    assert "id" in result
\ No newline at end of file
+    assert "id" in result
+
+def test_bulk_create_items(test_db):
+    # Insert several users in one call
+    new_users = [
+        {"name": "Frank", "email": "frank@example.com", "age": 45},
+        {"name": "Grace", "email": "grace@example.com", "age": 33},
+        {"name": "Heidi", "email": "heidi@example.com", "age": 29}
+    ]
+    result = bulk_create_items("users", new_users)
+    assert result["success"] is True
+
+    # Verify all rows were inserted
+    check_result = get_all_items("users")
+    names = [row["name"] for row in check_result["results"]]
+    assert "Frank" in names
+    assert "Grace" in names
+    assert "Heidi" in names
+
+    # Rows with mismatched columns are rejected
+    result = bulk_create_items("users", [{"name": "Ivan"}, {"email": "judy@example.com"}])
+    assert result["success"] is False
+
+    # Empty input is rejected
+    result = bulk_create_items("users", [])
+    assert result["success"] is False
+
+
+def test_bulk_update_items(test_db):
+    # Update two users in one call
+    updates = [
+        {"id": 1, "age": 31},
+        {"id": 2, "age": 26}
+    ]
+    result = bulk_update_items("users", updates, "id")
+    assert result["success"] is True
+
+    # Verify updates worked
+    assert get_item("users", "1", "id")["results"][0]["age"] == 31
+    assert get_item("users", "2", "id")["results"][0]["age"] == 26
+
+    # Rows missing the key column are rejected
+    result = bulk_update_items("users", [{"age": 50}], "id")
+    assert result["success"] is False
+
+
+def test_bulk_delete_items(test_db):
+    # Delete two users in one call
+    result = bulk_delete_items("users", [1, 2], "id")
+    assert result["success"] is True
+
+    # Verify deletions worked
+    assert len(get_item("users", "1", "id")["results"]) == 0
+    assert len(get_item("users", "2", "id")["results"]) == 0
+    assert len(get_item("users", "3", "id")["results"]) == 1
+
+
+def test_execute_query_columnar(test_db):
+    # Columnar shape returns column names once plus row value lists
+    result = execute_query("SELECT id, name FROM users ORDER BY id", columnar=True)
+    assert result["success"] is True
+    assert result["columns"] == ["id", "name"]
+    assert result["rows"][0] == [1, "Alice"]
+    assert len(result["rows"]) == 3
+
+
+def test_identifier_validation(test_db):
+    # Unknown table names are rejected before any SQL is built
+    result = get_item("nonexistent_table", "1", "id")
+    assert result["success"] is False
+    assert "Unknown table" in result["error"]
+
+    # Unknown column names are rejected too
+    result = get_item("users", "1", "nonexistent_column")
+    assert result["success"] is False
+    assert "Unknown column" in result["error"]
+
+    result = update_item("users", 1, {"nonexistent_column": 1}, "id")
+    assert result["success"] is False
+
+    result = get_all_items("users; DROP TABLE users")
+    assert result["success"] is False
+
+
+def test_read_cache_invalidation(test_db):
+    # Prime the cache, then make sure a write invalidates it
+    result = get_item("users", "1", "id")
+    assert result["results"][0]["age"] == 30
+
+    update_item("users", 1, {"age": 99}, "id")
+
+    result = get_item("users", "1", "id")
+    assert result["results"][0]["age"] == 99
+
+
+def test_raw_queries_are_not_cached(test_db):
+    # Nondeterministic reads through sqlite_query must be re-executed,
+    # not served from the result cache
+    first = execute_query("SELECT random() AS r")
+    second = execute_query("SELECT random() AS r")
+    assert first["success"] is True and second["success"] is True
+    assert first["results"][0]["r"] != second["results"][0]["r"]
+
+    # Opting in caches the result for repeated identical reads
+    first = execute_query("SELECT random() AS r", cache=True)
+    second = execute_query("SELECT random() AS r", cache=True)
+    assert first["results"][0]["r"] == second["results"][0]["r"]
+
+
+def test_wal_journal_mode():
+    # WAL only applies to file-backed databases, so this test uses a
+    # temporary file instead of the shared in-memory fixture
+    fd, db_path = tempfile.mkstemp()
+    os.close(fd)
+
+    import src.entry
+    original_db = src.entry.DB_NAME
+    src.entry._close_conn()
+    src.entry.DB_NAME = db_path
+
+    try:
+        # The shared connection should have switched the database to WAL mode
+        result = execute_query("PRAGMA journal_mode")
+        assert result["success"] is True
+        assert result["results"][0]["journal_mode"] == "wal"
+    finally:
+        src.entry._close_conn()
+        src.entry.DB_NAME = original_db
+        os.unlink(db_path)
+
+
+def test_read_cache_per_table_invalidation(test_db):
+    # Prime cached reads on both tables
+    assert get_all_items("users")["success"] is True
+    products_before = get_all_items("products")
+    assert len(products_before["results"]) == 2
+
+    # A write to users must not leave stale users reads behind
+    create_item("users", {"name": "Judy", "email": "judy@example.com", "age": 41})
+    users_after = get_all_items("users")
+    names = [row["name"] for row in users_after["results"]]
+    assert "Judy" in names
+
+    # Products reads are unaffected and still correct
+    products_after = get_all_items("products")
+    assert len(products_after["results"]) == 2
+
+
+def test_batch_transaction(test_db):
+    from src.entry import begin_batch, end_batch
+
+    # Writes between begin_batch and end_batch land in one transaction
+    assert begin_batch()["success"] is True
+    create_item("users", {"name": "Ken", "email": "ken@example.com", "age": 52})
+    create_item("users", {"name": "Lea", "email": "lea@example.com", "age": 48})
+    assert end_batch()["success"] is True
+
+    names = [row["name"] for row in get_all_items("users")["results"]]
+    assert "Ken" in names
+    assert "Lea" in names
+
+    # Batch bookkeeping errors are reported
+    assert end_batch()["success"] is False
+    assert begin_batch()["success"] is True
+    assert begin_batch()["success"] is False
+    assert end_batch()["success"] is True
+
+
+def test_batch_rollback(test_db):
+    from src.entry import begin_batch, rollback_batch
+
+    # Writes inside an aborted batch are discarded
+    assert begin_batch()["success"] is True
+    create_item("users", {"name": "Mia", "email": "mia@example.com", "age": 37})
+    names = [row["name"] for row in get_all_items("users")["results"]]
+    assert "Mia" in names
+    assert rollback_batch()["success"] is True
+
+    # Nothing was committed and no stale cached read survives
+    names = [row["name"] for row in get_all_items("users")["results"]]
+    assert "Mia" not in names
+
+    # The write lock is released: autocommit writes work again
+    result = create_item("users", {"name": "Ned", "email": "ned@example.com", "age": 61})
+    assert result["success"] is True
+    assert len(get_item("users", "Ned", "name")["results"]) == 1
+
+    # Rolling back with no batch open is reported as an error
+    assert rollback_batch()["success"] is False
+
+
+def test_get_all_items_columnar(test_db):
+    result = get_all_items("products", columnar=True)
+    assert result["success"] is True
+    assert result["columns"] == ["id", "name", "price"]
+    assert [1, "Laptop", 999.99] in result["rows"]
+    assert len(result["rows"]) == 2
+
+
+def test_wrapper_tools_surface_sql_errors(test_db):
+    # A constraint violation inside execute_query comes back as an error
+    # dict from the wrapper tools, not an exception
+    result = create_item("users", {"name": "Alice 2", "email": "alice@example.com", "age": 31})
+    assert result["success"] is False
+    assert "error" in result
+
+    result = update_item("users", 2, {"email": "alice@example.com"}, "id")
+    assert result["success"] is False
+    assert "error" in result
+
+
+def test_ddl_refreshes_schema_cache(test_db):
+    # Prime the schema cache with the initial tables
+    assert get_all_tables()["success"] is True
+    result = get_item("orders", "1", "id")
+    assert result["success"] is False
+
+    # DDL through sqlite_query must invalidate the cached schema
+    result = execute_query("CREATE TABLE orders (id INTEGER PRIMARY KEY, total REAL)")
+    assert result["success"] is True
+
+    # The new table is usable through the wrapper tools right away
+    result = create_item("orders", {"total": 19.99})
+    assert result["success"] is True
+    assert len(get_all_items("orders")["results"]) == 1
+
+    # And get_all_tables no longer serves the stale cached list
+    tables = [row["name"] for row in get_all_tables()["results"]]
+    assert "orders" in tables
+
+
+def test_ensure_indexes_skips_internal_tables(test_db):
+    # AUTOINCREMENT creates sqlite_sequence, which has a 'name' column but
+    # may not be indexed; _ensure_indexes must skip internal tables
+    result = execute_query(
+        "CREATE TABLE logs (id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT)"
+    )
+    assert result["success"] is True
+    assert create_item("logs", {"name": "boot"})["success"] is True
+
+    import src.entry
+    src.entry._ensure_indexes()
+
+    # Internal tables stay out of the schema the tools validate against
+    result = get_all_items("sqlite_sequence")
+    assert result["success"] is False
+
+
+def test_reserved_word_table_name(test_db):
+    # A table named after a SQL keyword must not break schema loading or
+    # the SQL the wrapper tools generate
+    result = execute_query('CREATE TABLE "order" (id INTEGER PRIMARY KEY, name TEXT)')
+    assert result["success"] is True
+
+    result = create_item("order", {"name": "first"})
+    assert result["success"] is True
+
+    result = get_item("order", "first", "name")
+    assert result["success"] is True
+    assert result["results"][0]["id"] == 1
+
+    result = update_item("order", 1, {"name": "updated"}, "id")
+    assert result["success"] is True
+
+    result = get_all_items("order")
+    assert len(result["results"]) == 1
+
+    # Index creation quotes identifiers the same way
+    import src.entry
+    src.entry._ensure_indexes()
+
+
+def test_update_with_no_data_is_rejected(test_db):
+    # Empty update data must come back as an error dict, not an exception
+    result = update_item("users", 1, {}, "id")
+    assert result["success"] is False
+    assert "error" in result
+
+    # Key-only rows leave nothing to update
+    result = bulk_update_items("users", [{"id": 1}], "id")
+    assert result["success"] is False
+    assert "error" in result